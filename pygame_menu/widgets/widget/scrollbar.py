@@ -18,7 +18,11 @@ from pygame_menu.widgets.core.widget import Widget, WidgetTransformationNotImple
 
 from pygame_menu._types import Optional, List, VectorIntType, ColorType, Literal, \
     Tuple2IntType, CallbackType, NumberInstance, ColorInputType, NumberType, \
-    EventVectorType, VectorInstance
+    EventVectorType, VectorInstance, EventType, Dict, Callable, EventListType, Tuple
+
+# Mouse buttons
+_CLICK_BUTTONS = frozenset((1, 2, 3))  # Left, middle, right
+_SCROLL_BUTTONS = frozenset((4, 5))  # Wheel up, down
 
 
 # noinspection PyMissingOrEmptyDocstring
@@ -49,17 +53,26 @@ class ScrollBar(Widget):
     :param onchange: Callback when pressing and moving the scroll
     """
     _clicked: bool
+    _abs_rect: Optional['pygame.Rect']
+    _apply_size_changes: Callable[[], None]
+    _effective_length: NumberType
+    _event_handlers: Dict[int, Callable[[EventType, 'pygame.Rect'], bool]]
     _last_mouse_pos: Tuple2IntType
+    _last_slider_render: Optional[Tuple['pygame.Rect', ColorType]]
     _orientation: Literal[0, 1]
     _page_ctrl_color: ColorType
     _page_ctrl_length: NumberType
     _page_ctrl_thick: int
     _page_step: NumberType
+    _scroll: Callable[[Tuple2IntType, Tuple2IntType, NumberType], bool]
     _shadow_color: ColorType
     _shadow_enabled: bool
     _shadow_offset: NumberType
+    _shadow_offset_double: NumberType
     _shadow_position: str
     _shadow_tuple: Tuple2IntType
+    _shadow_tuple_half: Tuple2IntType
+    _shift_pressed: Optional[bool]
     _single_step: NumberType
     _slider_color: ColorType
     _slider_hover_color: ColorType
@@ -67,6 +80,7 @@ class ScrollBar(Widget):
     _slider_position: int
     _slider_rect: Optional['pygame.Rect']
     _values_range: List[NumberType]
+    _values_span: NumberType
     _visible_force: int  # -1: not set, 0: hidden, 1: shown
     scrolling: bool
 
@@ -103,14 +117,32 @@ class ScrollBar(Widget):
             kwargs=kwargs
         )
 
+        self._abs_rect = None  # Absolute rect, cached while updating
         self._check_mouseleave_call_render = True
         self._clicked = False
         self._last_mouse_pos = (-1, -1)
+        self._last_slider_render = None  # Last slider rect and color drawn on surface
         self._mouseover_check_rect = lambda: self.get_slider_rect()
         self._orientation = 0  # 0: horizontal, 1: vertical
+        self._apply_size_changes = self._apply_size_changes_h
+        self._scroll = self._scroll_h
+        self._shift_pressed = None  # Shift key status, cached while updating
         self._values_range = list(values_range)
+        self._values_span = values_range[1] - values_range[0]
         self._visible_force = -1  # Visibility changed with force
 
+        # Event handlers
+        self._event_handlers = {
+            pygame.ACTIVEEVENT: self._on_active,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.MOUSEBUTTONDOWN: self._on_button_down,
+            pygame.MOUSEBUTTONUP: self._on_button_up,
+            pygame.MOUSEMOTION: self._on_motion,
+            FINGERDOWN: self._on_button_down,
+            FINGERMOTION: self._on_motion,
+            FINGERUP: self._on_button_up
+        }
+
         # Page control
         self._page_ctrl_color = page_ctrl_color
         self._page_ctrl_length = length
@@ -130,8 +162,11 @@ class ScrollBar(Widget):
         self._shadow_offset = 2.0
         self._shadow_position = POSITION_NORTHWEST
         self._shadow_tuple = (0, 0)  # (x px offset, y px offset)
+        self._shadow_offset_double = 2 * self._shadow_offset
+        self._shadow_tuple_half = (0, 0)
 
         # Page step
+        self._effective_length = length  # Slider travel, that is, length - page step
         self._page_step = 0
         self._single_step = 20
 
@@ -174,22 +209,34 @@ class ScrollBar(Widget):
     def flip(self, *args, **kwargs) -> 'ScrollBar':
         raise WidgetTransformationNotImplemented()
 
-    def _apply_size_changes(self) -> None:
+    def _apply_size_changes_h(self) -> None:
         """
-        Apply scrollbar changes.
+        Apply scrollbar changes, horizontal orientation.
         """
-        opp_orientation = 1 if self._orientation == 0 else 0  # Opposite of orientation
-        dims = ('width', 'height')
-        setattr(self._rect, dims[self._orientation], int(self._page_ctrl_length))
-        setattr(self._rect, dims[opp_orientation], self._page_ctrl_thick)
-        self._slider_rect = pygame.Rect(0, 0, int(self._rect.width), int(self._rect.height))
-        setattr(self._slider_rect, dims[self._orientation], int(self._page_step))
-        setattr(self._slider_rect, dims[opp_orientation], self._page_ctrl_thick)
+        self._effective_length = self._page_ctrl_length - self._page_step
+        self._rect.width = int(self._page_ctrl_length)
+        self._rect.height = self._page_ctrl_thick
+
+        # Update slider position according to the current one. The padding is
+        # rounded as pygame.Rect.inflate does
+        pad = int(2 * self._slider_pad)
+        offset = int(pad / 2)
+        self._slider_rect = pygame.Rect(int(self._slider_position) + offset, offset,
+                                        int(self._page_step) - pad, self._page_ctrl_thick - pad)
+
+    def _apply_size_changes_v(self) -> None:
+        """
+        Apply scrollbar changes, vertical orientation.
+        """
+        self._effective_length = self._page_ctrl_length - self._page_step
+        self._rect.width = self._page_ctrl_thick
+        self._rect.height = int(self._page_ctrl_length)
 
         # Update slider position according to the current one
-        pos = ('x', 'y')
-        setattr(self._slider_rect, pos[self._orientation], int(self._slider_position))
-        self._slider_rect = self._slider_rect.inflate(-2 * self._slider_pad, -2 * self._slider_pad)
+        pad = int(2 * self._slider_pad)
+        offset = int(pad / 2)
+        self._slider_rect = pygame.Rect(offset, int(self._slider_position) + offset,
+                                        self._page_ctrl_thick - pad, int(self._page_step) - pad)
 
     def set_shadow(
         self,
@@ -220,6 +267,10 @@ class ScrollBar(Widget):
         self._shadow_position = self._font_shadow_position
         self._shadow_tuple = self._font_shadow_tuple
 
+        # Precompute the slider shadow geometry used by render
+        self._shadow_offset_double = 2 * self._shadow_offset
+        self._shadow_tuple_half = (int(self._shadow_tuple[0] / 2), int(self._shadow_tuple[1] / 2))
+
         # Disable font
         self._font_shadow = False
         return self
@@ -269,7 +320,7 @@ class ScrollBar(Widget):
 
         :return: Page step
         """
-        p_step = self._page_step * (self._values_range[1] - self._values_range[0]) / self._page_ctrl_length
+        p_step = self._page_step * self._values_span / self._page_ctrl_length
         return int(p_step)
 
     def get_value_percentage(self) -> float:
@@ -278,9 +329,8 @@ class ScrollBar(Widget):
 
         :return: Value as percentage
         """
-        v_min, v_max = self.get_minmax()
-        value = self.get_value()
-        return round((value - v_min) / (v_max - v_min), 3)
+        v_min, v_max = int(self._values_range[0]), int(self._values_range[1])
+        return round((self.get_value() - v_min) / (v_max - v_min), 3)
 
     def get_value(self) -> int:
         """
@@ -288,36 +338,49 @@ class ScrollBar(Widget):
 
         :return: Position in px
         """
-        value = self._values_range[0] + self._slider_position * \
-                (self._values_range[1] - self._values_range[0]) / (self._page_ctrl_length - self._page_step)
+        v_min, v_max = self._values_range
+        value = v_min + self._slider_position * self._values_span / self._effective_length
 
         # Correction due to value scaling
-        value = max(self._values_range[0], value)
-        value = min(self._values_range[1], value)
-        return int(value)
+        return int(min(v_max, max(v_min, value)))
 
     def _render(self) -> Optional[bool]:
         width, height = self._rect.width + self._rect_size_delta[0], self._rect.height + self._rect_size_delta[1]
         if self._slider_rect is None:
             return
 
+        forced = self._last_render_hash == 0
         if not self._render_hash_changed(width, height, self._slider_rect.x, self._slider_rect.y,
                                          self.readonly, self._slider_rect.width, self._slider_rect.height,
                                          self.scrolling, self._mouseover, self._clicked):
             return True
 
-        self._surface = make_surface(width, height)
-        self._surface.fill(self._page_ctrl_color)
-
-        # Render slider
         slider_color = self._slider_color if not self.readonly else self._font_readonly_color
         mouse_hover = (self.scrolling and self._clicked) or self._mouseover
         slider_color = self._slider_hover_color if mouse_hover else slider_color
+
+        # If only the slider has moved, clear its previous area instead of
+        # creating and filling a new surface
+        last_slider = self._last_slider_render
+        if (
+            not forced and
+            last_slider is not None and
+            last_slider[1] == slider_color and
+            self._surface is not None and
+            self._surface.get_size() == (int(width), int(height))
+        ):
+            self._surface.fill(self._page_ctrl_color, last_slider[0])
+        else:
+            self._surface = make_surface(width, height)
+            self._surface.fill(self._page_ctrl_color)
+        self._last_slider_render = (pygame.Rect(self._slider_rect), slider_color)
+
+        # Render slider
         if self._shadow_enabled:
-            lit_rect = pygame.Rect(self._slider_rect)
-            slider_rect = lit_rect.inflate(-self._shadow_offset * 2, -self._shadow_offset * 2)
+            lit_rect = self._slider_rect
+            slider_rect = lit_rect.inflate(-self._shadow_offset_double, -self._shadow_offset_double)
             shadow_rect = lit_rect.inflate(-self._shadow_offset, -self._shadow_offset)
-            shadow_rect = shadow_rect.move(int(self._shadow_tuple[0] / 2), int(self._shadow_tuple[1] / 2))
+            shadow_rect.move_ip(self._shadow_tuple_half)
 
             pygame.draw.rect(self._surface, self._font_selected_color, lit_rect)
             pygame.draw.rect(self._surface, self._shadow_color, shadow_rect)
@@ -325,31 +388,53 @@ class ScrollBar(Widget):
         else:
             pygame.draw.rect(self._surface, slider_color, self._slider_rect)
 
-    def _scroll(self, rect: 'pygame.Rect', pixels: NumberType) -> bool:
+    def _scroll_h(self, rect_tl: Tuple2IntType, rect_br: Tuple2IntType, pixels: NumberType) -> bool:
         """
-        Moves the slider based on mouse events relative to change along axis.
+        Moves the slider based on mouse events relative to change along x-axis.
         The slider travel is limited to page control length.
 
-        :param rect: Precomputed rect
+        :param rect_tl: Precomputed rect top-left position
+        :param rect_br: Precomputed rect bottom-right position
+        :param pixels: Number of pixels to scroll
+        :return: ``True`` is scroll position has changed
+        """
+        if not pixels or self._slider_rect is None:
+            return False
+
+        # The slider rect is relative to the widget, thus the free space only
+        # depends on the page control length
+        space_before = self._slider_pad - self._slider_rect.x
+        space_after = rect_br[0] - rect_tl[0] - self._slider_rect.right - self._slider_pad
+        move = min(max(round(pixels), space_before), space_after)
+
+        if not move:
+            return False
+
+        self._slider_rect.move_ip(move, 0)
+        self._slider_position += move
+        return True
+
+    def _scroll_v(self, rect_tl: Tuple2IntType, rect_br: Tuple2IntType, pixels: NumberType) -> bool:
+        """
+        Moves the slider based on mouse events relative to change along y-axis.
+        The slider travel is limited to page control length.
+
+        :param rect_tl: Precomputed rect top-left position
+        :param rect_br: Precomputed rect bottom-right position
         :param pixels: Number of pixels to scroll
         :return: ``True`` is scroll position has changed
         """
-        assert isinstance(pixels, NumberInstance)
         if not pixels or self._slider_rect is None:
             return False
 
-        axis = self._orientation
-        space_before = rect.topleft[axis] - self._slider_rect.move(*rect.topleft).topleft[axis] + self._slider_pad
-        move = max(round(pixels), space_before)
-        space_after = rect.bottomright[axis] - self._slider_rect.move(*rect.topleft).bottomright[axis] - self._slider_pad
-        move = min(move, space_after)
+        space_before = self._slider_pad - self._slider_rect.y
+        space_after = rect_br[1] - rect_tl[1] - self._slider_rect.bottom - self._slider_pad
+        move = min(max(round(pixels), space_before), space_after)
 
         if not move:
             return False
 
-        move_pos = [0, 0]
-        move_pos[axis] = move
-        self._slider_rect.move_ip(*move_pos)
+        self._slider_rect.move_ip(0, move)
         self._slider_position += move
         return True
 
@@ -428,6 +513,7 @@ class ScrollBar(Widget):
         assert value > self._values_range[0], \
             f'maximum value shall greater than {self._values_range[0]}'
         self._values_range[1] = value
+        self._values_span = value - self._values_range[0]
 
     def set_minimum(self, value: NumberType) -> None:
         """
@@ -439,6 +525,7 @@ class ScrollBar(Widget):
         assert 0 <= value < self._values_range[1], \
             f'minimum value shall lower than {self._values_range[1]}'
         self._values_range[0] = value
+        self._values_span = self._values_range[1] - value
 
     def set_orientation(self, orientation: str) -> None:
         """
@@ -450,11 +537,23 @@ class ScrollBar(Widget):
 
         :param orientation: Widget orientation
         """
-        assert_orientation(orientation)
+        # Known orientations skip the validation, which is only
+        # required to report invalid values
         if orientation == ORIENTATION_HORIZONTAL:
             self._orientation = 0
         elif orientation == ORIENTATION_VERTICAL:
             self._orientation = 1
+        else:
+            assert_orientation(orientation)
+
+        # The orientation is fixed until changed again, thus bind the
+        # specialized methods
+        if self._orientation == 0:
+            self._apply_size_changes = self._apply_size_changes_h
+            self._scroll = self._scroll_h
+        else:
+            self._apply_size_changes = self._apply_size_changes_v
+            self._scroll = self._scroll_v
         self._apply_size_changes()
 
     def set_page_step(self, value: NumberType) -> None:
@@ -473,7 +572,7 @@ class ScrollBar(Widget):
         assert 0 < value, 'page step shall be > 0'
 
         # Slider length shall represent the same ratio
-        self._page_step = self._page_ctrl_length * value / (self._values_range[1] - self._values_range[0])
+        self._page_step = self._page_ctrl_length * value / self._values_span
 
         if self._single_step >= self._page_step:
             self._single_step = self._page_step // 2  # Arbitrary to be lower than page step
@@ -490,15 +589,14 @@ class ScrollBar(Widget):
         assert self._values_range[0] <= position_value <= self._values_range[1], \
             f'{self._values_range[0]} < {position_value} < {self._values_range[1]}'
 
-        pixels = (position_value - self._values_range[0]) * \
-                 (self._page_ctrl_length - self._page_step)
-        pixels /= (self._values_range[1] - self._values_range[0])
+        length = self._effective_length
+        pixels = (position_value - self._values_range[0]) * length / self._values_span
 
         # Correction due to value scaling
-        pixels = max(0, pixels)
-        pixels = min(self._page_ctrl_length - self._page_step, pixels)
+        pixels = min(length, max(0, pixels))
 
-        self._scroll(self.get_rect(), pixels - self._slider_position)
+        rect = self.get_rect()
+        self._scroll(rect.topleft, rect.bottomright, pixels - self._slider_position)
 
     def get_slider_rect(self) -> 'pygame.Rect':
         """
@@ -506,7 +604,206 @@ class ScrollBar(Widget):
 
         :return: Slider rect
         """
-        return self._slider_rect.move(*self.get_rect(to_absolute_position=True).topleft)
+        rect = self._abs_rect
+        if rect is None:
+            rect = self.get_rect(to_absolute_position=True)
+        return self._slider_rect.move(rect.x, rect.y)
+
+    def _on_keydown(self, event: EventType, rect: 'pygame.Rect') -> bool:
+        """
+        User press PAGEUP or PAGEDOWN.
+
+        :param event: Event
+        :param rect: Precomputed rect
+        :return: ``True`` if updated
+        """
+        if (
+            event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN) and
+            self._keyboard_enabled and
+            self._orientation == 1 and
+            not self.scrolling
+        ):
+            direction = 1 if event.key == pygame.K_PAGEDOWN else -1
+            if self._shift_pressed is None:  # Keyboard state does not change within update
+                keys_pressed = pygame.key.get_pressed()
+                self._shift_pressed = keys_pressed[pygame.K_LSHIFT] or keys_pressed[pygame.K_RSHIFT]
+            step = self._page_step
+            if self._shift_pressed:
+                step *= 0.35
+            pixels = direction * step
+            if self._scroll(rect.topleft, rect.bottomright, pixels):
+                self.change()
+                return True
+        return False
+
+    def _on_motion(self, event: EventType, rect: 'pygame.Rect') -> bool:
+        """
+        User moves mouse (or finger) while scrolling.
+
+        :param event: Event
+        :param rect: Precomputed rect
+        :return: ``True`` if updated
+        """
+        if not self.scrolling or not (
+            event.type == pygame.MOUSEMOTION and self._mouse_enabled and hasattr(event, 'rel') or
+            event.type == FINGERMOTION and self._touchscreen_enabled and self._menu is not None
+        ):
+            return False
+
+        # Get relative movement
+        menu = self._menu
+        orientation = self._orientation
+        mouse_motion = event.type == pygame.MOUSEMOTION
+        rel = event.rel[orientation] if mouse_motion else \
+            menu is not None and (
+                event.dx * 2 * menu.get_window_size()[0] if orientation == 0 else
+                event.dy * 2 * menu.get_window_size()[1]
+            )
+
+        # If mouse outside region and scroll is on limits, ignore
+        mx, my = event.pos if mouse_motion else get_finger_pos(menu, event)
+        slider_rect = self._slider_rect
+        scrollarea = self._scrollarea
+        if (
+            self.get_value_percentage() in (0, 1) and
+            scrollarea is not None and
+            scrollarea.get_parent() is not None and
+            slider_rect is not None
+        ):
+            if orientation == 1:  # Vertical
+                h = slider_rect.height / 2
+                if my > (rect.bottom - h) or my < (rect.top + h):
+                    return False
+            else:  # Horizontal
+                w = slider_rect.width / 2
+                if mx > (rect.right - w) or mx < (rect.left + w):
+                    return False
+
+        # Check scrolling
+        if self._scroll(rect.topleft, rect.bottomright, rel):
+            self.change()
+            return True
+        return False
+
+    def _on_active(self, event: EventType, rect: 'pygame.Rect') -> bool:
+        """
+        Mouse enters or leaves the window.
+
+        :param event: Event
+        :param rect: Precomputed rect
+        :return: ``True`` if updated
+        """
+        if not hasattr(event, 'gain'):
+            return False
+        mx, my = pygame.mouse.get_pos()
+        if event.gain != 1:  # Leave
+            self._last_mouse_pos = (mx, my)
+        else:
+            lmx, lmy = self._last_mouse_pos
+            self._last_mouse_pos = (-1, -1)
+            if lmx == -1 or lmy == -1:
+                return False
+            if self.scrolling:
+                if self._orientation == 0:  # Horizontal
+                    self._scroll(rect.topleft, rect.bottomright, mx - lmx)
+                else:
+                    self._scroll(rect.topleft, rect.bottomright, my - lmy)
+        return False
+
+    def _on_button_down(self, event: EventType, rect: 'pygame.Rect') -> bool:
+        """
+        User clicks the slider rect.
+
+        :param event: Event
+        :param rect: Precomputed rect
+        :return: ``True`` if updated
+        """
+        if not (
+            event.type == pygame.MOUSEBUTTONDOWN and self._mouse_enabled or
+            event.type == FINGERDOWN and self._touchscreen_enabled and self._menu is not None
+        ):
+            return False
+
+        # Vertical bar: scroll down (4) or up (5). Mouse must be placed
+        # over the area to enable this feature
+        if (
+            not event.type == FINGERDOWN and
+            event.button in _SCROLL_BUTTONS and
+            self._orientation == 1 and
+            (
+                self._scrollarea is not None and self._scrollarea.mouse_is_over() or
+                self._scrollarea is None
+            )
+        ):
+            direction = -1 if event.button == 4 else 1
+            if self._scroll(rect.topleft, rect.bottomright, direction * self._single_step):
+                self.change()
+                return True
+
+        # Click button (left, middle, right)
+        elif event.type == FINGERDOWN or event.button in _CLICK_BUTTONS:
+            event_pos = get_finger_pos(self._menu, event)
+
+            # The _slider_rect origin is related to the widget surface
+            slider_abs = self._slider_rect.move(rect.x, rect.y)
+            if slider_abs.collidepoint(*event_pos):
+                # Initialize scrolling
+                self.scrolling = True
+                self._clicked = True
+                self._render()
+                return True
+
+            elif rect.collidepoint(*event_pos):
+                # Moves towards the click by one "page" (= slider length without pad)
+                pos = slider_abs.y if self._orientation else slider_abs.x
+                direction = 1 if event_pos[self._orientation] > pos else -1
+                if self._scroll(rect.topleft, rect.bottomright, direction * self._page_step):
+                    self.change()
+                    return True
+
+        return False
+
+    def _on_button_up(self, event: EventType, rect: 'pygame.Rect') -> bool:
+        """
+        User releases mouse button if scrolling.
+
+        :param event: Event
+        :param rect: Precomputed rect
+        :return: ``True`` if updated
+        """
+        if (event.type == pygame.MOUSEBUTTONUP and self._mouse_enabled or
+                event.type == FINGERUP and self._touchscreen_enabled) and self.scrolling:
+            self._clicked = False
+            self.scrolling = False
+
+            # Mouseover was not checked while dragging, thus update it at release
+            if event.type == pygame.MOUSEBUTTONUP and hasattr(event, 'pos'):
+                self._check_mouseover(pygame.event.Event(pygame.MOUSEMOTION, {'pos': event.pos}))
+            self._render()
+            return True
+        return False
+
+    @staticmethod
+    def _coalesce_motion(events: EventListType) -> EventListType:
+        """
+        Merge each run of consecutive mouse motion events into a single event,
+        which keeps the last position and adds up the relative movement.
+
+        :param events: Event list
+        :return: Coalesced event list
+        """
+        motion = pygame.MOUSEMOTION
+        coalesced = []
+        append = coalesced.append
+        for event in events:
+            if event.type == motion and hasattr(event, 'rel') and coalesced:
+                prev = coalesced[-1]
+                if prev.type == motion and hasattr(prev, 'rel'):
+                    rel = (prev.rel[0] + event.rel[0], prev.rel[1] + event.rel[1])
+                    coalesced[-1] = pygame.event.Event(motion, dict(event.dict, rel=rel))
+                    continue
+            append(event)
+        return coalesced
 
     def update(self, events: EventVectorType) -> bool:
         self.apply_update_callbacks(events)
@@ -515,131 +812,33 @@ class ScrollBar(Widget):
             self._readonly_check_mouseover(events)
             return False
 
+        # Keep only the events handled by the scrollbar
+        handlers = self._event_handlers
+        events = [event for event in events if event.type in handlers]
+        if not events:
+            return False
+
+        # While dragging, scroll once per motion burst instead of once per event
+        if self.scrolling and len(events) > 1:
+            events = self._coalesce_motion(events)
+
+        # The absolute rect is reused by the slider rect while updating
         rect = self.get_rect(to_absolute_position=True)
+        self._abs_rect = rect
 
-        for event in events:
+        check_mouseover = self._check_mouseover
+        try:
+            for event in events:
 
-            # Check mouse over
-            self._check_mouseover(event)
-
-            # User press PAGEUP or PAGEDOWN
-            if (
-                event.type == pygame.KEYDOWN and
-                event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN) and
-                self._keyboard_enabled and
-                self._orientation == 1 and
-                not self.scrolling
-            ):
-                direction = 1 if event.key == pygame.K_PAGEDOWN else -1
-                keys_pressed = pygame.key.get_pressed()
-                step = self._page_step
-                if keys_pressed[pygame.K_LSHIFT] or keys_pressed[pygame.K_RSHIFT]:
-                    step *= 0.35
-                pixels = direction * step
-                if self._scroll(rect, pixels):
-                    self.change()
-                    return True
+                # Check mouse over. While dragging, the slider is drawn as hovered
+                # anyway, thus mouse motion does not need the collision test
+                if not (self.scrolling and event.type == pygame.MOUSEMOTION):
+                    check_mouseover(event)
 
-            # User moves mouse while scrolling
-            elif self.scrolling and (
-                event.type == pygame.MOUSEMOTION and self._mouse_enabled and hasattr(event, 'rel') or
-                event.type == FINGERMOTION and self._touchscreen_enabled and self._menu is not None
-            ):
-                # Get relative movement
-                h = self.get_orientation() == ORIENTATION_HORIZONTAL
-                rel = event.rel[self._orientation] if event.type == pygame.MOUSEMOTION else \
-                    self._menu is not None and (
-                        event.dx * 2 * self._menu.get_window_size()[0] if h else
-                        event.dy * 2 * self._menu.get_window_size()[1]
-                    )
-
-                # If mouse outside region and scroll is on limits, ignore
-                mx, my = event.pos if event.type == pygame.MOUSEMOTION else \
-                    get_finger_pos(self._menu, event)
-                if (
-                    self.get_value_percentage() in (0, 1) and
-                    self.get_scrollarea() is not None and
-                    self.get_scrollarea().get_parent() is not None and
-                    self._slider_rect is not None
-                ):
-                    if self._orientation == 1:  # Vertical
-                        h = self._slider_rect.height / 2
-                        if my > (rect.bottom - h) or my < (rect.top + h):
-                            continue
-                    elif self._orientation == 0:  # Horizontal
-                        w = self._slider_rect.width / 2
-                        if mx > (rect.right - w) or mx < (rect.left + w):
-                            continue
-
-                # Check scrolling
-                if self._scroll(rect, rel):
-                    self.change()
+                if handlers[event.type](event, rect):
                     return True
 
-            # Mouse enters or leaves the window
-            elif event.type == pygame.ACTIVEEVENT and hasattr(event, 'gain'):
-                mx, my = pygame.mouse.get_pos()
-                if event.gain != 1:  # Leave
-                    self._last_mouse_pos = (mx, my)
-                else:
-                    lmx, lmy = self._last_mouse_pos
-                    self._last_mouse_pos = (-1, -1)
-                    if lmx == -1 or lmy == -1:
-                        continue
-                    if self.scrolling:
-                        if self._orientation == 0:  # Horizontal
-                            self._scroll(rect, mx - lmx)
-                        else:
-                            self._scroll(rect, my - lmy)
-
-            # User clicks the slider rect
-            elif (
-                event.type == pygame.MOUSEBUTTONDOWN and self._mouse_enabled or
-                event.type == FINGERDOWN and self._touchscreen_enabled and self._menu is not None
-            ):
-                # Vertical bar: scroll down (4) or up (5). Mouse must be placed
-                # over the area to enable this feature
-                if (
-                    not event.type == FINGERDOWN and
-                    event.button in (4, 5) and
-                    self._orientation == 1 and
-                    (
-                        self._scrollarea is not None and self._scrollarea.mouse_is_over() or
-                        self._scrollarea is None
-                    )
-                ):
-                    direction = -1 if event.button == 4 else 1
-                    if self._scroll(rect, direction * self._single_step):
-                        self.change()
-                        return True
-
-                # Click button (left, middle, right)
-                elif event.type == FINGERDOWN or event.button in (1, 2, 3):
-                    event_pos = get_finger_pos(self._menu, event)
-
-                    # The _slider_rect origin is related to the widget surface
-                    if self.get_slider_rect().collidepoint(*event_pos):
-                        # Initialize scrolling
-                        self.scrolling = True
-                        self._clicked = True
-                        self._render()
-                        return True
-
-                    elif rect.collidepoint(*event_pos):
-                        # Moves towards the click by one "page" (= slider length without pad)
-                        s_rect = self.get_slider_rect()
-                        pos = (s_rect.x, s_rect.y)
-                        direction = 1 if event_pos[self._orientation] > pos[self._orientation] else -1
-                        if self._scroll(rect, direction * self._page_step):
-                            self.change()
-                            return True
-
-            # User releases mouse button if scrolling
-            elif (event.type == pygame.MOUSEBUTTONUP and self._mouse_enabled or
-                  event.type == FINGERUP and self._touchscreen_enabled) and self.scrolling:
-                self._clicked = False
-                self.scrolling = False
-                self._render()
-                return True
-
-        return False
+            return False
+        finally:
+            self._abs_rect = None
+            self._shift_pressed = None
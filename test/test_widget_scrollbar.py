@@ -104,6 +104,21 @@ class ScrollBarWidgetTest(BaseTest):
         sb.readonly = True
         self.assertFalse(sb.update([]))
 
+        # Consecutive motion events are merged while scrolling
+        sb.readonly = False
+        sb.set_value(500)
+        sb.scrolling = True
+        motion = PygameEventUtils.middle_rect_click(sb.get_slider_rect(), rel=(0, 5), evtype=pygame.MOUSEMOTION)
+        pos = sb._slider_rect.y
+        self.assertTrue(sb.update(motion * 3))
+        self.assertEqual(sb._slider_rect.y, pos + 15)
+        events = sb._coalesce_motion(motion * 2 + PygameEventUtils.key(pygame.K_PAGEUP, keydown=True) + motion)
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[0].rel, (0, 10))
+        self.assertEqual(events[2].rel, (0, 5))
+        sb.update(PygameEventUtils.middle_rect_click(sb.get_slider_rect(), button=5, delta=(0, 50), rel=(0, 999), evtype=pygame.MOUSEMOTION))
+        sb.readonly = True
+
         # Ignore events if mouse outside the region
         sb.update(PygameEventUtils.middle_rect_click(sb.get_slider_rect(), button=5, delta=(0, 999), rel=(0, -10), evtype=pygame.MOUSEMOTION))
         self.assertIn(sb.get_value_percentage(), (0.976, 1))
@@ -113,6 +128,11 @@ class ScrollBarWidgetTest(BaseTest):
         self.assertIsNone(sb._onreturn)
         self.assertTrue(sb._kwargs.get('onreturn', 0))
 
+        # Invalid orientation
+        self.assertRaises(AssertionError, lambda: sb.set_orientation('invalid'))
+        self.assertRaises(AssertionError, lambda: sb.set_orientation(1))
+        self.assertEqual(sb.get_orientation(), ORIENTATION_VERTICAL)
+
         # Scrollbar ignores scaling
         self.assertRaises(WidgetTransformationNotImplemented, lambda: sb.scale(2, 2))
         self.assertFalse(sb._scale[0])
@@ -154,3 +174,41 @@ class ScrollBarWidgetTest(BaseTest):
         sb.reset_value()
         self.assertEqual(sb.get_value(), 0)
         self.assertFalse(sb.value_changed())
+
+    def test_render(self) -> None:
+        """
+        Test scrollbar render.
+        """
+        sb = ScrollBar(300, (0, 1000), 'sb', slider_pad=2)
+        sb._render()
+        surface_sb = sb._surface
+        self.assertIsNotNone(sb._last_slider_render)
+
+        # Moving the slider only redraws the slider area
+        sb.set_value(500)
+        sb._render()
+        self.assertIs(sb._surface, surface_sb)
+        self.assertEqual(sb._last_slider_render[0], sb._slider_rect)
+        partial = pygame.image.tostring(sb._surface, 'RGBA')
+        sb.render()
+        self.assertIsNot(sb._surface, surface_sb)
+        self.assertEqual(pygame.image.tostring(sb._surface, 'RGBA'), partial)
+
+    def test_mouseover_scrolling(self) -> None:
+        """
+        Test scrollbar mouseover while dragging the slider.
+        """
+        sb = ScrollBar(300, (0, 1000), 'sb', ORIENTATION_VERTICAL, page_ctrl_thick=30)
+        sb.update(PygameEventUtils.middle_rect_click(sb.get_slider_rect(), evtype=pygame.MOUSEMOTION))
+        self.assertTrue(sb._mouseover)
+        sb.update(PygameEventUtils.middle_rect_click(sb.get_slider_rect(), evtype=pygame.MOUSEBUTTONDOWN))
+        self.assertTrue(sb.scrolling)
+
+        # Motion outside the slider does not change the mouseover while dragging
+        sb.update(PygameEventUtils.middle_rect_click((500, 500), evtype=pygame.MOUSEMOTION))
+        self.assertTrue(sb._mouseover)
+
+        # Releasing outside the slider updates the mouseover status
+        sb.update(PygameEventUtils.middle_rect_click((500, 500), evtype=pygame.MOUSEBUTTONUP))
+        self.assertFalse(sb.scrolling)
+        self.assertFalse(sb._mouseover)